@@ -0,0 +1,25 @@
+from django.core.cache import cache
+
+from rest_framework.authentication import TokenAuthentication
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """Token authentication that caches lookups to skip the DB hit
+
+    Plain TokenAuthentication issues one SELECT per request to resolve
+    the token key. Keep the resolved (user, token) pair in the cache so
+    repeated requests with the same key authenticate without touching
+    the database.
+    """
+    cache_timeout = 300
+
+    def authenticate_credentials(self, key):
+        cache_key = 'tok:{}'.format(key)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        user, token = super().authenticate_credentials(key)
+        cache.set(cache_key, (user, token), self.cache_timeout)
+
+        return user, token
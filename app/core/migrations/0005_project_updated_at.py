@@ -0,0 +1,18 @@
+# Generated by Django 2.1.15 on 2026-08-27 04:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_auto_20260827_0419'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
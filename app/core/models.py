@@ -62,6 +62,12 @@ class Project(models.Model):
     price = models.DecimalField(max_digits=7, decimal_places=2)
     link = models.CharField(max_length=255, blank=True)
     tags = models.ManyToManyField('Tag')
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', '-id'], name='project_user_id_desc'),
+        ]
 
     def __str__(self):
         return self.title
@@ -0,0 +1,17 @@
+import orjson
+
+from rest_framework import renderers
+
+
+class ORJSONRenderer(renderers.BaseRenderer):
+    """Render API responses to JSON using orjson"""
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+    render_style = 'binary'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        return orjson.dumps(data, default=str)
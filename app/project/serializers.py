@@ -1,9 +1,34 @@
+import copy
+from collections import OrderedDict
+
+from django.db import models
+
 from rest_framework import serializers
 
 from core.models import Tag, Project
 
 
-class TagSerializer(serializers.ModelSerializer):
+class FieldCacheMixin:
+    """Cache the generated serializer fields per class
+
+    ModelSerializer rebuilds its fields dict on every instantiation even
+    though the result only depends on the class. Build the fields once,
+    then hand out fresh copies on subsequent calls.
+    """
+    _fields_cache = {}
+
+    def get_fields(self):
+        cls = type(self)
+        if cls not in self._fields_cache:
+            self._fields_cache[cls] = super().get_fields()
+
+        return {
+            name: copy.deepcopy(field)
+            for name, field in self._fields_cache[cls].items()
+        }
+
+
+class TagSerializer(FieldCacheMixin, serializers.ModelSerializer):
     """Serializer for tag objects"""
 
     class Meta:
@@ -12,12 +37,99 @@ class TagSerializer(serializers.ModelSerializer):
         read_only_fields = ('id',)
 
 
-class ProjectSerializer(serializers.ModelSerializer):
+class ManyTagRelatedField(serializers.ManyRelatedField):
+    """Resolve all submitted tag ids with a single query"""
+
+    def _request_cache(self):
+        """Return the per-request memo of already resolved tags"""
+        request = self.context.get('request')
+        if request is None:
+            return {}
+        if not hasattr(request, '_tag_cache'):
+            request._tag_cache = {}
+
+        return request._tag_cache
+
+    def to_internal_value(self, data):
+        if isinstance(data, str) or not hasattr(data, '__iter__'):
+            self.fail('not_a_list', input_type=type(data).__name__)
+        if not self.allow_empty and len(data) == 0:
+            self.fail('empty')
+
+        child = self.child_relation
+        tags = self._request_cache()
+        missing = [pk for pk in data if str(pk) not in tags]
+        if missing:
+            try:
+                tags.update({
+                    str(tag.pk): tag
+                    for tag in child.get_queryset().filter(pk__in=missing)
+                })
+            except (TypeError, ValueError):
+                for pk in missing:
+                    try:
+                        int(pk)
+                    except (TypeError, ValueError):
+                        child.fail(
+                            'incorrect_type', data_type=type(pk).__name__
+                        )
+                raise
+
+        resolved = []
+        for pk in data:
+            try:
+                resolved.append(tags[str(pk)])
+            except KeyError:
+                child.fail('does_not_exist', pk_value=pk)
+
+        return resolved
+
+
+class TagRelatedField(serializers.PrimaryKeyRelatedField):
+    """Primary key field for tags owned by the requesting user"""
+
+    def get_queryset(self):
+        return Tag.objects.filter(
+            user=self.context['request'].user
+        ).only('id')
+
+    @classmethod
+    def many_init(cls, *args, **kwargs):
+        list_kwargs = {'child_relation': cls(*args, **kwargs)}
+        for key in kwargs:
+            if key in serializers.MANY_RELATION_KWARGS:
+                list_kwargs[key] = kwargs[key]
+
+        return ManyTagRelatedField(**list_kwargs)
+
+
+class ProjectListSerializer(serializers.ListSerializer):
+    """Serialize a list of projects by reading attributes directly
+
+    Bypasses the per-field get_attribute dispatch that dominates list
+    responses; every field is a plain model attribute, and the tags
+    come out of the prefetch cache.
+    """
+
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, models.Manager) else data
+
+        return [
+            OrderedDict((
+                ('id', project.id),
+                ('title', project.title),
+                ('description', project.description),
+                ('tags', [tag.pk for tag in project.tags.all()]),
+                ('price', '{:.2f}'.format(project.price)),
+                ('link', project.link),
+            ))
+            for project in iterable
+        ]
+
+
+class ProjectSerializer(FieldCacheMixin, serializers.ModelSerializer):
     """Serialize a project"""
-    tags = serializers.PrimaryKeyRelatedField(
-        many=True,
-        queryset=Tag.objects.all()
-    )
+    tags = TagRelatedField(many=True)
 
     class Meta:
         model = Project
@@ -25,8 +137,30 @@ class ProjectSerializer(serializers.ModelSerializer):
             'id', 'title', 'description', 'tags', 'price', 'link'
         )
         read_only_fields = ('id',)
+        list_serializer_class = ProjectListSerializer
+
+    def create(self, validated_data):
+        """Create a project, writing its tag links in one bulk insert"""
+        tags = validated_data.pop('tags', [])
+        project = Project.objects.create(**validated_data)
+        if tags:
+            through = Project.tags.through
+            through.objects.bulk_create([
+                through(project_id=project.pk, tag_id=pk)
+                for pk in dict.fromkeys(tag.pk for tag in tags)
+            ])
+
+        return project
 
 
 class ProjectDetailSerializer(ProjectSerializer):
     """Serialize a project detail"""
-    tags = TagSerializer(many=True, read_only=True)
+
+    def to_representation(self, instance):
+        """Emit the prefetched tags directly, skipping a nested serializer"""
+        ret = super().to_representation(instance)
+        ret['tags'] = [
+            {'id': tag.id, 'name': tag.name} for tag in instance.tags.all()
+        ]
+
+        return ret
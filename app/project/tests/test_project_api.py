@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from django.contrib.auth import get_user_model
 from django.test import TestCase
 from django.urls import reverse
@@ -13,11 +15,17 @@ from project.serializers import ProjectSerializer, ProjectDetailSerializer
 PROJECTS_URL = reverse('project:project-list')
 
 
+@lru_cache(maxsize=1024)
 def detail_url(project_id):
     """Return project detail URL"""
     return reverse('project:project-detail', args=[project_id])
 
 
+def fetch_projects(ids):
+    """Return a dict of projects for the given ids in a single query"""
+    return Project.objects.in_bulk(ids)
+
+
 def sample_tag(user, name='Main project'):
     """Create and return a sample tag"""
     return Tag.objects.create(user=user, name=name)
@@ -88,6 +96,16 @@ class PrivateProjectApiTests(TestCase):
         self.assertEqual(len(res.data), 1)
         self.assertEqual(res.data, serializer.data)
 
+    def test_retrieve_projects_not_modified(self):
+        """Test that an unchanged project list returns 304"""
+        sample_project(user=self.user)
+
+        first = self.client.get(PROJECTS_URL)
+        res = self.client.get(PROJECTS_URL, HTTP_IF_NONE_MATCH=first['ETag'])
+
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertTrue(res.has_header('Last-Modified'))
+
     def test_view_project_detail(self):
         """Test viewing a project detail"""
         project = sample_project(user=self.user)
@@ -109,7 +127,7 @@ class PrivateProjectApiTests(TestCase):
         res = self.client.post(PROJECTS_URL, payload)
 
         self.assertEqual(res.status_code, status.HTTP_201_CREATED)
-        project = Project.objects.get(id=res.data['id'])
+        project = fetch_projects([res.data['id']])[res.data['id']]
         for key in payload.keys():
             self.assertEqual(payload[key], getattr(project, key))
 
@@ -126,12 +144,42 @@ class PrivateProjectApiTests(TestCase):
         res = self.client.post(PROJECTS_URL, payload)
 
         self.assertEqual(res.status_code, status.HTTP_201_CREATED)
-        project = Project.objects.get(id=res.data['id'])
+        project = fetch_projects([res.data['id']])[res.data['id']]
         tags = project.tags.all()
         self.assertEqual(tags.count(), 2)
         self.assertIn(tag1, tags)
         self.assertIn(tag2, tags)
 
+    def test_create_project_with_malformed_tag(self):
+        """Test creating a project with a non-numeric tag id fails"""
+        payload = {
+            'title': 'Django Project',
+            'tags': ['abc'],
+            'description': 'A little Django project about projects',
+            'price': 5.00
+        }
+        res = self.client.post(PROJECTS_URL, payload)
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('received str', str(res.data['tags']))
+
+    def test_create_project_with_duplicate_tags(self):
+        """Test creating a project with a repeated tag id"""
+        tag = sample_tag(user=self.user, name='Internal')
+        payload = {
+            'title': 'Videogame with Unreal Engine',
+            'tags': [tag.id, tag.id],
+            'description': 'A massive open world videogame',
+            'price': 5.00
+        }
+        res = self.client.post(PROJECTS_URL, payload)
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        project = fetch_projects([res.data['id']])[res.data['id']]
+        tags = project.tags.all()
+        self.assertEqual(tags.count(), 1)
+        self.assertIn(tag, tags)
+
     def test_parcial_update_recipe(self):
         """Test updating a recipe with patch"""
         project = sample_project(user=self.user)
@@ -1,31 +1,79 @@
+import hashlib
+
+from django.db.models import Count, Exists, Max, OuterRef, Prefetch
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
+
 from rest_framework import viewsets, mixins
-from rest_framework.authentication import TokenAuthentication
 from rest_framework.permissions import IsAuthenticated
 
+from core.authentication import CachedTokenAuthentication
 from core.models import Tag, Project
 
 from project import serializers
 
 
+_TRUTHY = frozenset({'1', 'true', 'True', 'yes'})
+
+
+def _projects_state(request):
+    """Return the last change time and count of the user's projects
+
+    Memoized on the request so the ETag and Last-Modified validators
+    share a single aggregate query.
+    """
+    if not hasattr(request, '_projects_state'):
+        request._projects_state = Project.objects.filter(
+            user=request.user
+        ).aggregate(
+            last_updated=Max('updated_at'),
+            total=Count('id'),
+        )
+
+    return request._projects_state
+
+
+def _projects_etag(request, *args, **kwargs):
+    """Compute an ETag for the user's project collection"""
+    if not request.user.is_authenticated:
+        return None
+    state = _projects_state(request)
+
+    return hashlib.md5('{}:{}:{}'.format(
+        request.user.pk, state['last_updated'], state['total']
+    ).encode()).hexdigest()
+
+
+def _projects_last_modified(request, *args, **kwargs):
+    """Return when the user's projects last changed"""
+    if not request.user.is_authenticated:
+        return None
+
+    return _projects_state(request)['last_updated']
+
+
 class BaseProjectAttrViewSet(viewsets.GenericViewSet,
                              mixins.ListModelMixin,
                              mixins.CreateModelMixin):
     """Base viewset for user owned project attributes"""
-    authentication_classes = (TokenAuthentication,)
+    authentication_classes = (CachedTokenAuthentication,)
     permission_classes = (IsAuthenticated,)
 
     def get_queryset(self):
         """Return objects for the current authenticated user only"""
-        assigned_only = bool(
-            int(self.request.query_params.get('assigned_only', 0))
+        if not self.request.user.is_authenticated:
+            return self.queryset.none()
+
+        assigned_only = (
+            self.request.query_params.get('assigned_only') in _TRUTHY
         )
-        queryset = self.queryset
+        queryset = self.queryset.filter(user=self.request.user)
         if assigned_only:
-            queryset = queryset.filter(recipe__isnull=False)
+            queryset = queryset.annotate(
+                assigned=Exists(Project.objects.filter(tags=OuterRef('pk')))
+            ).filter(assigned=True)
 
-        return queryset.filter(
-            user=self.request.user
-        ).order_by('-name').distinct()
+        return queryset.order_by('-name')
 
     def perform_create(self, serializer):
         """Create a new object"""
@@ -38,23 +86,64 @@ class TagViewSet(BaseProjectAttrViewSet):
     serializer_class = serializers.TagSerializer
 
 
+def _project_list_queryset(user):
+    """Build the queryset for the project list action"""
+    return Project.objects.filter(user=user).only(
+        'id', 'title', 'description', 'price', 'link'
+    ).prefetch_related('tags').order_by('-id')
+
+
+def _project_detail_queryset(user):
+    """Build the queryset for the project retrieve action"""
+    return Project.objects.filter(user=user).prefetch_related(
+        Prefetch('tags', queryset=Tag.objects.only('id', 'name'))
+    )
+
+
+def _project_default_queryset(user):
+    """Build the queryset for project write actions"""
+    return Project.objects.filter(user=user)
+
+
 class ProjectViewSet(viewsets.ModelViewSet):
     """Manage projects in the database"""
     serializer_class = serializers.ProjectSerializer
     queryset = Project.objects.all()
-    authentication_classes = (TokenAuthentication,)
+    authentication_classes = (CachedTokenAuthentication,)
     permission_classes = (IsAuthenticated,)
 
+    _SERIALIZERS = {'retrieve': serializers.ProjectDetailSerializer}
+    _QUERYSET_BUILDERS = {
+        'list': _project_list_queryset,
+        'retrieve': _project_detail_queryset,
+    }
+
+    @method_decorator(condition(etag_func=_projects_etag,
+                                last_modified_func=_projects_last_modified))
+    def list(self, request, *args, **kwargs):
+        """List projects, honouring conditional request headers"""
+        return super().list(request, *args, **kwargs)
+
+    @method_decorator(condition(etag_func=_projects_etag,
+                                last_modified_func=_projects_last_modified))
+    def retrieve(self, request, *args, **kwargs):
+        """Retrieve a project, honouring conditional request headers"""
+        return super().retrieve(request, *args, **kwargs)
+
     def get_queryset(self):
         """Retrieve the project for the authenticated user"""
-        return self.queryset.filter(user=self.request.user)
+        if not self.request.user.is_authenticated:
+            return self.queryset.none()
+
+        builder = self._QUERYSET_BUILDERS.get(
+            self.action, _project_default_queryset
+        )
+
+        return builder(self.request.user)
 
     def get_serializer_class(self):
         """Return appropiate serializer class"""
-        if self.action == 'retrieve':
-            return serializers.ProjectDetailSerializer
-
-        return self.serializer_class
+        return self._SERIALIZERS.get(self.action, self.serializer_class)
 
     def perform_create(self, serializer):
         """Create a new project"""